@@ -1,39 +1,71 @@
+import functools
 import logging
 from pathlib import Path
 from textwrap import dedent
+from typing import TYPE_CHECKING
 
-import rich_click as click
+import click
 
-# Ensure export/show registration for all scenarios
-import policy_inspector.scenarios.shadowing.export  # noqa: F401
-import policy_inspector.scenarios.shadowing.show  # noqa: F401
 from policy_inspector.config import (
     config_option,
+    device_groups_options,
     export_options,
     panorama_options,
     show_options,
 )
-from policy_inspector.mock_panorama import MockPanoramaConnector
-from policy_inspector.panorama import PanoramaConnector
 from policy_inspector.scenario import Scenario
-from policy_inspector.scenarios.shadowing.advanced import AdvancedShadowing
-from policy_inspector.scenarios.shadowing.simple import Shadowing
 from policy_inspector.utils import (
+    RICH_CLICK,
     Example,
     ExampleChoice,
     VerboseGroup,
-    config_logger,
 )
 
-config_logger()
+if TYPE_CHECKING:
+    from policy_inspector.panorama import PanoramaConnector
 
-click.rich_click.SHOW_ARGUMENTS = True
-click.rich_click.TEXT_MARKUP = "markdown"
-click.rich_click.USE_MARKDOWN = True
-click.rich_click.SHOW_METAVARS_COLUMN = True
+if RICH_CLICK:
+    import rich_click
+
+    rich_click.rich_click.SHOW_ARGUMENTS = True
+    rich_click.rich_click.TEXT_MARKUP = "markdown"
+    rich_click.rich_click.USE_MARKDOWN = True
+    rich_click.rich_click.SHOW_METAVARS_COLUMN = True
 
 logger = logging.getLogger(__name__)
 
+_SEPARATOR = "\n-----------------------\n"
+
+
+@functools.cache
+def get_scenarios() -> dict[str, type[Scenario]]:
+    """Import built-in Scenarios on first use and map them by command name.
+
+    Scenario modules pull in models, the resolver and their show/export
+    functions, so they are imported only by commands that need them.
+    """
+    # Ensure export/show registration for all scenarios
+    import policy_inspector.scenarios.shadowing.export  # noqa: F401
+    import policy_inspector.scenarios.shadowing.show  # noqa: F401
+    from policy_inspector.scenarios.shadowing.advanced import (
+        AdvancedShadowing,
+    )
+    from policy_inspector.scenarios.shadowing.simple import Shadowing
+
+    return {"shadowing": Shadowing, "shadowingvalue": AdvancedShadowing}
+
+
+@functools.cache
+def _short_doc(check) -> str:
+    """Return docstring of ``check`` collapsed into a single line."""
+    return " ".join((check.__doc__ or "").split())
+
+
+@functools.cache
+def _dedented_doc(scenario: type[Scenario]) -> str:
+    """Return docstring of ``scenario`` without common indentation."""
+    return dedent(scenario.__doc__ or "")
+
 
 @click.group(no_args_is_help=True, add_help_option=True, cls=VerboseGroup)
 def main():
@@ -45,24 +77,20 @@ def main():
 @main.command("list")
 def main_list() -> None:
     """List available Scenarios."""
-    logger.info("")
-    logger.info("-----------------------")
-    logger.info("")
+    get_scenarios()
+    lines = [_SEPARATOR]
     for scenario in Scenario.get_available().values():
-        logger.info(f"→ '{scenario.name}'")
-        scenario_doc = scenario.__doc__
+        lines.append(f"→ '{scenario.name}'")
+        scenario_doc = _dedented_doc(scenario)
         if scenario_doc:
-            doc = dedent(scenario_doc)
-            logger.info(f"{doc}")
+            lines.append(scenario_doc)
         checks = getattr(scenario, "checks", None)
         if checks:
             for check in scenario.checks:
-                logger.info(f"\t▶ '{check.__name__}'")
-                doc = check.__doc__.replace("\n", "")
-                logger.info(f"\t  {doc}")
-        logger.info("")
-        logger.info("-----------------------")
-        logger.info("")
+                lines.append(f"\t▶ '{check.__name__}'")
+                lines.append(f"\t  {_short_doc(check)}")
+        lines.append(_SEPARATOR)
+    logger.info("\n".join(lines))
 
 
 @main.group("run", no_args_is_help=True, cls=VerboseGroup)
@@ -91,10 +119,14 @@ def run_scenario_with_panorama(
     export: tuple[str, ...] = (),
     export_dir: str | None = ".",
     show: tuple[str, ...] = ("text",),
-    panorama_cls: type[PanoramaConnector] = PanoramaConnector,
+    panorama_cls: type["PanoramaConnector"] | None = None,
     **kwargs,
 ) -> None:
     """Common scenario execution logic for Panorama-based scenarios."""
+    if panorama_cls is None:
+        from policy_inspector.panorama import PanoramaConnector
+
+        panorama_cls = PanoramaConnector
     panorama = panorama_cls(
         hostname=panorama_hostname,
         username=panorama_username,
@@ -104,10 +136,7 @@ def run_scenario_with_panorama(
     )
     scenario = scenario_cls(panorama=panorama, **kwargs)
     scenario.execute_and_analyze()
-    if show:
-        scenario.show(show)
-    if export:
-        scenario.export(export, output_dir=export_dir)
+    scenario.report(show, export, output_dir=export_dir)
 
 
 def run_scenario_with_mock_data(
@@ -121,6 +150,8 @@ def run_scenario_with_mock_data(
     **kwargs,
 ) -> None:
     """Run scenario using mock data from JSON files."""
+    from policy_inspector.mock_panorama import MockPanoramaConnector
+
     # Create mock panorama connector
     panorama = MockPanoramaConnector(
         data_dir=data_dir,
@@ -137,65 +168,55 @@ def run_scenario_with_mock_data(
         panorama=panorama, device_groups=device_groups_list, **kwargs
     )
     scenario.execute_and_analyze()
-    if show:
-        scenario.show(show)
-    if export:
-        scenario.export(export, output_dir=export_dir)
+    scenario.report(show, export, output_dir=export_dir)
+
+
+def panorama_scenario_options(f):
+    """Decorator with options shared by scenarios run against Panorama."""
+    f = device_groups_options(f)
+    f = export_options(f)
+    f = show_options(f)
+    f = panorama_options(f)
+    return config_option()(f)
 
 
 @main_run.command("shadowing", no_args_is_help=True)
-@config_option()
-@panorama_options
-@show_options
-@export_options
-@click.option(
-    "--device-groups",
-    multiple=True,
-    help="Device groups to analyze (can be specified multiple times)",
-)
+@panorama_scenario_options
 def run_shadowing(**kwargs) -> None:
     """Run shadowing analysis using Panorama data."""
-    run_scenario_with_panorama(**kwargs)
+    run_scenario_with_panorama(get_scenarios()["shadowing"], **kwargs)
 
 
 @main_run.command("shadowingvalue", no_args_is_help=True)
-@config_option()
-@panorama_options
-@show_options
-@export_options
-@click.option(
-    "--device-groups",
-    multiple=True,
-    help="Device groups to analyze (can be specified multiple times)",
-)
+@panorama_scenario_options
 def run_shadowingvalue(**kwargs) -> None:
     """Run advanced shadowing analysis using Panorama data."""
-    run_scenario_with_panorama(AdvancedShadowing, **kwargs)
+    run_scenario_with_panorama(get_scenarios()["shadowingvalue"], **kwargs)
 
 
 examples = [
     Example(
         name="shadowing-basic",
-        scenario=Shadowing,
+        scenario="shadowing",
         data_dir="1",
         device_group="Example 1",
     ),
     Example(
         name="shadowing-multiple-dg",
-        scenario=Shadowing,
+        scenario="shadowing",
         data_dir="2",
         device_group="Example 2",
     ),
     Example(
         name="shadowingvalue-basic",
-        scenario=AdvancedShadowing,
+        scenario="shadowingvalue",
         data_dir="3",
         device_group="Example 3 - Advanced",
         show=("table",),
     ),
     Example(
         name="shadowingvalue-with-export",
-        scenario=AdvancedShadowing,
+        scenario="shadowingvalue",
         data_dir="3",
         device_group="Example 3 - Advanced",
         show=("text",),
@@ -212,27 +233,24 @@ examples = [
     "example",
     type=ExampleChoice(examples),
 )
-@click.option(
-    "--device-groups",
-    multiple=True,
-    help="Device groups to analyze (can be specified multiple times)",
-)
+@device_groups_options
 def run_example(
     show: tuple[str, ...],
     export: tuple[str, ...],
     export_dir,
     device_groups: tuple[str],
+    max_workers: int,
     example: Example,
 ) -> None:
     """Run one of the examples."""
-    logger.info(f"▶ Selected example: '{example.name}'")
+    logger.info("▶ Selected example: '%s'", example.name)
     logger.info(
         "This is a demonstration run using example config/data. Results may not reflect your environment."
     )
 
     # Get the data directory from the example
     data_dir = example.get_data_dir()
-    logger.info(f"Data directory: {data_dir.absolute()}")
+    logger.info("Data directory: %s", data_dir)
     logger.info("Executing scenario with provided example data...")
 
     try:
@@ -242,10 +260,11 @@ def run_example(
 
         # Call run_scenario_with_mock_data directly
         run_scenario_with_mock_data(
-            scenario_cls=example.scenario,
+            scenario_cls=get_scenarios()[example.scenario],
             data_dir=data_dir,
             device_group=example.device_group,
             device_groups=device_groups,
+            max_workers=max_workers,
             show=final_show,
             export=final_export,
             export_dir=export_dir,
@@ -256,7 +275,7 @@ def run_example(
         logger.error(
             "Example run failed. This is expected if required files or connectivity are missing."
         )
-        logger.error(f"Error: {ex}")
+        logger.error("Error: %s", ex)
     finally:
         logger.info("Example execution completed")
 
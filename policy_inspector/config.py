@@ -1,10 +1,28 @@
+import functools
 import logging
+import os
 
-import rich_click as click
-import yaml
+import click
 
 logger = logging.getLogger(__name__)
 
+_CONFIG_FILE_TYPE = click.Path(dir_okay=False)
+_EXPORT_DIR_TYPE = click.Path(file_okay=False, dir_okay=True)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_yaml(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse YAML file at ``path``.
+
+    Cached by file modification time and size, so an unchanged file is
+    parsed only once per process.
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path) as f:
+        return yaml.load(f, Loader=loader) or {}  # noqa: S506
+
 
 def configure_from_yaml(ctx, param, filename):
     """
@@ -20,30 +38,34 @@ def configure_from_yaml(ctx, param, filename):
         return
 
     try:
-        with open(filename) as f:
-            data = yaml.safe_load(f) or {}
+        stat = os.stat(filename)
     except FileNotFoundError:
         # If config file doesn't exist, just continue with no defaults
         return
+
+    import yaml
+
+    try:
+        data = _load_yaml(
+            os.path.abspath(filename), stat.st_mtime_ns, stat.st_size
+        )
     except yaml.YAMLError as e:
         raise click.BadParameter(f"Invalid YAML in config file: {e}") from e
 
-    ctx.default_map = {}
-
-    for key, value in data.items():
-        if key == "panorama" and isinstance(value, dict):
-            for pano_key, pano_value in value.items():
-                ctx.default_map[f"panorama_{pano_key}"] = pano_value
-        elif isinstance(value, dict):
-            ctx.default_map[key] = value
-        else:
-            if isinstance(value, list):
-                value = tuple(value)
-            ctx.default_map[key] = value
+    # ``data`` is shared by the parse cache, so it must not be mutated
+    panorama = data.get("panorama")
+    nested_panorama = isinstance(panorama, dict)
+    ctx.default_map = {
+        key: tuple(value) if isinstance(value, list) else value
+        for key, value in data.items()
+        if not (nested_panorama and key == "panorama")
+    }
+    if nested_panorama:
+        ctx.default_map.update(
+            {f"panorama_{key}": value for key, value in panorama.items()}
+        )
 
     logger.debug("Default map set from YAML: %s", ctx.default_map)
-    logger.debug("Final ctx.default_map: %s", ctx.default_map)
-    print("ctx.default_map:", ctx.default_map)
 
 
 def config_option(
@@ -67,7 +89,7 @@ def config_option(
     def decorator(f):
         return click.option(
             config_file_name,
-            type=click.Path(dir_okay=False),
+            type=_CONFIG_FILE_TYPE,
             default=default,
             callback=configure_from_yaml,
             is_eager=True,
@@ -79,42 +101,85 @@ def config_option(
     return decorator
 
 
-def show_options(f):
-    """Decorator that adds --show click options to a command."""
-    options = [
-        click.option(
-            "-s",
-            "--show",
-            multiple=True,
-            help="Output format (can be specified multiple times)",
-        )
-    ]
+def _apply_options(f, options):
+    """Apply click ``options`` to ``f`` so they show up in listed order."""
     for option in reversed(options):
         f = option(f)
     return f
 
 
+_SHOW_OPTIONS = (
+    click.option(
+        "-s",
+        "--show",
+        multiple=True,
+        help="Output format (can be specified multiple times)",
+    ),
+)
+
+_EXPORT_OPTIONS = (
+    click.option(
+        "-ed",
+        "--export-dir",
+        default=".",
+        type=_EXPORT_DIR_TYPE,
+        show_default=True,
+        help="Directory to save exported files (default: current directory)",
+    ),
+    click.option(
+        "-e",
+        "--export",
+        multiple=True,
+        help="Export format (can be specified multiple times)",
+    ),
+)
+
+_DEVICE_GROUPS_OPTIONS = (
+    click.option(
+        "--device-groups",
+        multiple=True,
+        help="Device groups to analyze (can be specified multiple times)",
+    ),
+    click.option(
+        "--max-workers",
+        type=click.IntRange(min=1),
+        default=1,
+        show_default=True,
+        help="Number of threads loading security rules of device groups",
+    ),
+)
+
+_PANORAMA_OPTIONS = (
+    click.option(
+        "--panorama-verify-ssl",
+        type=bool,
+        default=False,
+        help="Verify SSL certificates",
+    ),
+    click.option(
+        "--panorama-api-version", default="v11.1", help="PAN-OS API version"
+    ),
+    click.option(
+        "--panorama-password", help="Panorama password", hide_input=True
+    ),
+    click.option("--panorama-username", help="Panorama username"),
+    click.option("--panorama-hostname", help="Panorama hostname"),
+)
+
+
+def show_options(f):
+    """Decorator that adds --show click options to a command."""
+    return _apply_options(f, _SHOW_OPTIONS)
+
+
 def export_options(f):
     """Decorator that adds --export and --export-dir options to a command."""
-    options = [
-        click.option(
-            "-ed",
-            "--export-dir",
-            default=".",
-            type=click.Path(file_okay=False, dir_okay=True),
-            show_default=True,
-            help="Directory to save exported files (default: current directory)",
-        ),
-        click.option(
-            "-e",
-            "--export",
-            multiple=True,
-            help="Export format (can be specified multiple times)",
-        ),
-    ]
-    for option in reversed(options):
-        f = option(f)
-    return f
+    return _apply_options(f, _EXPORT_OPTIONS)
+
+
+def device_groups_options(f):
+    """Decorator that adds --device-groups and --max-workers options."""
+    return _apply_options(f, _DEVICE_GROUPS_OPTIONS)
 
 
 def panorama_options(f):
@@ -134,24 +199,4 @@ def panorama_options(f):
     Returns:
         The decorated function with panorama options added
     """
-    options = [
-        click.option(
-            "--panorama-verify-ssl",
-            type=bool,
-            default=False,
-            help="Verify SSL certificates",
-        ),
-        click.option(
-            "--panorama-api-version", default="v11.1", help="PAN-OS API version"
-        ),
-        click.option(
-            "--panorama-password", help="Panorama password", hide_input=True
-        ),
-        click.option("--panorama-username", help="Panorama username"),
-        click.option("--panorama-hostname", help="Panorama hostname"),
-    ]
-    for option in reversed(options):
-        f = option(f)
-
-    logger.debug("Panorama options applied: %s", options)
-    return f
+    return _apply_options(f, _PANORAMA_OPTIONS)
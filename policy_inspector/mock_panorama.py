@@ -1,17 +1,30 @@
 """Mock Panorama connector for examples and testing."""
 
+import functools
 import logging
 from pathlib import Path
 from typing import Literal
 
 from policy_inspector.model.address_group import AddressGroup
 from policy_inspector.model.address_object import AddressObject
+from policy_inspector.model.base import MainModel
 from policy_inspector.model.security_rule import SecurityRule
 from policy_inspector.utils import load_json
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=32)
+def _load_entries(path: str, mtime_ns: int, size: int) -> list[dict]:
+    """Read JSON entries from file at ``path``.
+
+    Cached by file modification time and size, so an unchanged file is read
+    and parsed only once per process. Models are built from the entries on
+    every call, so the returned list must not be mutated.
+    """
+    return load_json(Path(path)) or []
+
+
 class MockPanoramaConnector:
     """Mock Panorama connector that reads data from JSON files.
 
@@ -32,9 +45,29 @@ class MockPanoramaConnector:
         self.data_dir = Path(data_dir)
         self.device_group = device_group
         logger.info(
-            f"✓ Mock Panorama connector initialized with data from {data_dir}"
+            "✓ Mock Panorama connector initialized with data from %s", data_dir
         )
 
+    def _load_file(self, model_cls: type[MainModel], file_name: str) -> list:
+        """Load ``model_cls`` instances from ``file_name`` in data directory."""
+        file_path = self.data_dir / file_name
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            logger.warning("%s file not found: %s", model_cls.plural, file_path)
+            return []
+
+        entries = _load_entries(
+            str(file_path.resolve()), stat.st_mtime_ns, stat.st_size
+        )
+        if not entries:
+            logger.warning("No %s found in file", model_cls.plural)
+            return []
+
+        models = model_cls.parse_json(entries)
+        logger.info("✓ Loaded %d %s", len(models), model_cls.plural)
+        return models
+
     def get_address_objects(
         self, device_group: str | None = None
     ) -> list[AddressObject]:
@@ -47,19 +80,7 @@ class MockPanoramaConnector:
             List of ``AddressObject`` instances.
         """
         logger.info("↺ Loading Address Objects from JSON file")
-        file_path = self.data_dir / "address_objects.json"
-
-        if not file_path.exists():
-            logger.warning(f"Address objects file not found: {file_path}")
-            return []
-
-        entries = load_json(file_path)
-        if not entries:
-            logger.warning("No Address Objects found in file")
-            return []
-
-        logger.info(f"✓ Loaded {len(entries)} Address Objects")
-        return AddressObject.parse_json(entries)
+        return self._load_file(AddressObject, "address_objects.json")
 
     def get_address_groups(
         self, device_group: str | None = None
@@ -73,19 +94,7 @@ class MockPanoramaConnector:
             List of ``AddressGroup`` instances
         """
         logger.info("↺ Loading Address Groups from JSON file")
-        file_path = self.data_dir / "address_groups.json"
-
-        if not file_path.exists():
-            logger.warning(f"Address groups file not found: {file_path}")
-            return []
-
-        entries = load_json(file_path)
-        if not entries:
-            logger.warning("No Address Groups found in file")
-            return []
-
-        logger.info(f"✓ Loaded {len(entries)} Address Groups")
-        return AddressGroup.parse_json(entries)
+        return self._load_file(AddressGroup, "address_groups.json")
 
     def get_security_rules(
         self,
@@ -102,19 +111,7 @@ class MockPanoramaConnector:
             List of ``SecurityRule`` instances.
         """
         logger.info("↺ Loading Security Rules from JSON file")
-        file_path = self.data_dir / "policies.json"
-
-        if not file_path.exists():
-            logger.warning(f"Security rules file not found: {file_path}")
-            return []
-
-        entries = load_json(file_path)
-        if not entries:
-            logger.warning("No Security Rules found in file")
-            return []
-
-        logger.info(f"✓ Loaded {len(entries)} Security Rules")
-        return SecurityRule.parse_json(entries)
+        return self._load_file(SecurityRule, "policies.json")
 
     def get_device_groups(self) -> list[str]:
         """Return mock device groups.
@@ -1,4 +1,5 @@
 import logging
+from functools import cache, cached_property
 from ipaddress import IPv4Address, IPv4Network
 from typing import ClassVar
 
@@ -9,6 +10,21 @@ from policy_inspector.model.base import MainModel
 logger = logging.getLogger(__name__)
 
 
+@cache
+def parse_ipv4_network(value: str) -> IPv4Network:
+    """Parse ``value`` into an ``IPv4Network``, reusing earlier results.
+
+    The same networks are repeated across Address Objects, device groups and
+    literal rule members, and ``IPv4Network`` instances are immutable.
+    """
+    return IPv4Network(value, strict=False)
+
+
+def bounds_cover(inner: tuple[int, int], outer: tuple[int, int]) -> bool:
+    """Check if ``inner`` integer bounds lie entirely within ``outer``."""
+    return outer[0] <= inner[0] and inner[1] <= outer[1]
+
+
 class AddressObject(MainModel):
     """Base class representing a network address object."""
 
@@ -101,10 +117,20 @@ class AddressObjectIPNetwork(AddressObject):
             ValueError: For invalid network formats
         """
         try:
+            if isinstance(v, str):
+                return parse_ipv4_network(v)
             return IPv4Network(v, strict=False)
         except ValueError as ex:
             raise ValueError(f"value '{v}' is not a valid IPv4 network") from ex
 
+    @cached_property
+    def bounds(self) -> tuple[int, int]:
+        """First and last address of the network as integers."""
+        return (
+            int(self.value.network_address),
+            int(self.value.broadcast_address),
+        )
+
     def is_covered_by(self, other: "AddressObject") -> bool:
         """Check if this network is fully contained within another object.
 
@@ -113,13 +139,8 @@ class AddressObjectIPNetwork(AddressObject):
             - Contained within another IP network
             - Fully inside an IP range
         """
-        if isinstance(other, AddressObjectIPNetwork):
-            return self.value.subnet_of(other.value)
-        if isinstance(other, AddressObjectIPRange):
-            return (
-                self.value.network_address >= other.value[0]
-                and self.value.broadcast_address <= other.value[1]
-            )
+        if isinstance(other, AddressObjectIPNetwork | AddressObjectIPRange):
+            return bounds_cover(self.bounds, other.bounds)
         return False
 
 
@@ -153,6 +174,11 @@ class AddressObjectIPRange(AddressObject):
             raise ValueError("last IP address must be greater than first")
         return v
 
+    @cached_property
+    def bounds(self) -> tuple[int, int]:
+        """First and last address of the range as integers."""
+        return int(self.value[0]), int(self.value[1])
+
     def is_covered_by(self, other: "AddressObject") -> bool:
         """Check if this range is fully contained within another object.
 
@@ -161,17 +187,8 @@ class AddressObjectIPRange(AddressObject):
             - Fully inside another IP network
             - Contained within another IP range
         """
-        if isinstance(other, AddressObjectIPNetwork):
-            network_start = other.value.network_address
-            network_end = other.value.broadcast_address
-            return (
-                self.value[0] >= network_start and self.value[1] <= network_end
-            )
-        if isinstance(other, AddressObjectIPRange):
-            return (
-                self.value[0] >= other.value[0]
-                and self.value[1] <= other.value[1]
-            )
+        if isinstance(other, AddressObjectIPNetwork | AddressObjectIPRange):
+            return bounds_cover(self.bounds, other.bounds)
         return False
 
 
@@ -1,4 +1,5 @@
 import logging
+import threading
 from typing import Literal
 
 import urllib3
@@ -7,6 +8,7 @@ from requests import RequestException, Session
 from policy_inspector.model.address_group import AddressGroup
 from policy_inspector.model.address_object import AddressObject
 from policy_inspector.model.security_rule import SecurityRule
+from policy_inspector.utils import parse_json
 
 logger = logging.getLogger(__name__)
 
@@ -50,13 +52,29 @@ class PanoramaConnector:
         }
         self.token = None
         self.timeout = timeout
-        self.session = Session()
+        self._local = threading.local()
 
         self._authenticate(username, password)
 
+    @property
+    def session(self) -> Session:
+        """``Session`` of the current thread.
+
+        ``requests.Session`` is not guaranteed to be thread-safe, so each
+        thread requesting data from Panorama gets its own one.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = Session()
+        return session
+
+    @session.setter
+    def session(self, value: Session) -> None:
+        self._local.session = value
+
     def _authenticate(self, username: str, password: str) -> None:
         """Authenticate to Panorama REST API and get token."""
-        logger.info(f"↺ Connecting to Panorama at {self.hostname}")
+        logger.info("↺ Connecting to Panorama at %s", self.hostname)
         try:
             response = self.session.post(
                 f"https://{self.hostname}:{self.port}/api/?type=keygen",
@@ -97,14 +115,18 @@ class PanoramaConnector:
                 json=data,
             )
             response.raise_for_status()
-            return response.json()
-
         except RequestException as ex:
             error_msg = f"Panorama API request failed \n{str(ex)}"
             if hasattr(ex, "response") and ex.response:
                 error_msg = f"{error_msg}\n{ex.response.text}"
             raise ValueError(error_msg) from ex
 
+        try:
+            return parse_json(response.content)
+        except ValueError as ex:
+            error_msg = f"Panorama API request failed \n{str(ex)}"
+            raise ValueError(f"{error_msg}\n{response.text}") from ex
+
     def _get_api_request(
         self,
         endpoint: str,
@@ -134,7 +156,7 @@ class PanoramaConnector:
         if not entries:
             logger.warning("No Address Objects found")
             return []
-        logger.info(f"✓ Retrieved {len(entries)} Address Objects")
+        logger.info("✓ Retrieved %d Address Objects", len(entries))
         return AddressObject.parse_json(entries)
 
     def get_address_groups(
@@ -158,7 +180,7 @@ class PanoramaConnector:
         if not entries:
             logger.warning("No Address Groups found")
             return []
-        logger.info(f"✓ Retrieved {len(entries)} Address Groups")
+        logger.info("✓ Retrieved %d Address Groups", len(entries))
         return AddressGroup.parse_json(entries)
 
     def get_security_rules(
@@ -192,7 +214,7 @@ class PanoramaConnector:
         if not entries:
             logger.warning("No Security Rules found")
             return []
-        logger.info(f"✓ Retrieved {len(entries)} Security Rules")
+        logger.info("✓ Retrieved %d Security Rules", len(entries))
         return SecurityRule.parse_json(entries)
 
     def get_device_groups(self) -> list[str]:
@@ -36,18 +36,36 @@ class Resolver:
             ag.name: ag.static for ag in address_groups
         }
         self.cache: dict[str, list[AddressObject]] = {}
+        self.names_cache: dict[frozenset[str], tuple[AddressObject, ...]] = {}
 
     def resolve(self, names: Iterable[str]) -> list["AddressObject"]:
         """Resolve given names.
 
+        Results are cached by the whole set of names, so rules sharing the
+        same source or destination members are resolved only once.
+
         Args:
             names: Names of ``Address Groups`` or ``Address Objects``
         """
-        result = []
-        for name in names:
-            result.extend(self._resolve_name(name))
+        key = frozenset(names)
+        if key in self.names_cache:
+            return list(self.names_cache[key])
+
+        result = self._union(self._resolve_name(name) for name in key)
+        self.names_cache[key] = tuple(result)
         return result
 
+    @staticmethod
+    def _union(
+        resolved: Iterable[list["AddressObject"]],
+    ) -> list["AddressObject"]:
+        """Merge resolved lists, keeping each Address Object only once."""
+        merged: dict[str, AddressObject] = {}
+        for objects in resolved:
+            for obj in objects:
+                merged.setdefault(obj.name, obj)
+        return list(merged.values())
+
     def _resolve_name(self, name: str) -> list["AddressObject"]:
         """Resolve single ``name``"""
         if name == "any":
@@ -57,17 +75,18 @@ class Resolver:
             return self.cache[name]
 
         try:
-            logger.debug(f"Resolving Address Group by name: {name}")
-            resolved = []
-            for member in self.address_groups[name]:
-                resolved.extend(self._resolve_name(member))
+            logger.debug("Resolving Address Group by name: %s", name)
+            members = self.address_groups[name]
+            resolved = self._union(
+                self._resolve_name(member) for member in members
+            )
             self.cache[name] = resolved
             return resolved
         except KeyError:
             pass
 
         try:
-            logger.debug(f"Resolving Address Object by name: {name}")
+            logger.debug("Resolving Address Object by name: %s", name)
             resolved = [self.address_objects[name]]
             self.cache[name] = resolved
             return resolved
@@ -76,7 +95,7 @@ class Resolver:
 
         try:
             logger.debug(
-                f"Creating {AddressObjectIPNetwork} from value: {name}"
+                "Creating %s from value: %s", AddressObjectIPNetwork, name
             )
             resolved = [AddressObjectIPNetwork(name=name, value=name)]
             self.cache[name] = resolved
@@ -85,7 +104,9 @@ class Resolver:
             pass
 
         try:
-            logger.debug(f"Creating {AddressObjectIPRange} from value: {name}")
+            logger.debug(
+                "Creating %s from value: %s", AddressObjectIPRange, name
+            )
             resolved = [AddressObjectIPRange(name=name, value=name)]
             self.cache[name] = resolved
             return resolved
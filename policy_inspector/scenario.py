@@ -62,16 +62,17 @@ class Scenario:
         """
         Show scenario results in the given formats using registered show functions.
         """
-        for fmt in formats:
-            show_func = None
-            from policy_inspector.utils import get_show_func
+        from policy_inspector.utils import get_show_func
 
+        for fmt in dict.fromkeys(formats):
             show_func = get_show_func(self, fmt)
             if show_func:
                 show_func(self, *args, **kwargs)
             else:
                 logger.warning(
-                    f"No show function registered for {type(self).__name__} and format '{fmt}'"
+                    "No show function registered for %s and format '%s'",
+                    type(self).__name__,
+                    fmt,
                 )
 
     def export(self, formats, *args, output_dir: str = None, **kwargs):
@@ -81,10 +82,9 @@ class Scenario:
         """
         from pathlib import Path
 
-        for fmt in formats:
-            export_func = None
-            from policy_inspector.utils import get_export_func
+        from policy_inspector.utils import get_export_func
 
+        for fmt in dict.fromkeys(formats):
             export_func = get_export_func(self, fmt)
             if export_func:
                 if fmt == "html":
@@ -96,14 +96,31 @@ class Scenario:
                     export_func(
                         self, *args, output_path=str(output_path), **kwargs
                     )
-                    logger.info(f"HTML report saved to: {output_path}")
+                    logger.info("HTML report saved to: %s", output_path)
                 else:
                     export_func(self, *args, **kwargs)
             else:
                 logger.warning(
-                    f"No export function registered for {type(self).__name__} and format '{fmt}'"
+                    "No export function registered for %s and format '%s'",
+                    type(self).__name__,
+                    fmt,
                 )
 
+    def report(
+        self,
+        show: tuple[str, ...] = (),
+        export: tuple[str, ...] = (),
+        output_dir: str | None = None,
+    ) -> None:
+        """Show and export results of an already analyzed scenario.
+
+        Each requested format is handled once, even if given repeatedly.
+        """
+        if show:
+            self.show(show)
+        if export:
+            self.export(export, output_dir=output_dir)
+
     def execute(self) -> ScenarioResults:
         """
         Execute the scenario logic.
@@ -1,6 +1,10 @@
 import logging
 
-from policy_inspector.model.address_object import AddressObjectFQDN
+from policy_inspector.model.address_object import (
+    AddressObject,
+    AddressObjectFQDN,
+    bounds_cover,
+)
 from policy_inspector.model.base import AnyObj
 from policy_inspector.model.security_rule import AdvancedSecurityRule
 from policy_inspector.resolver import Resolver
@@ -19,6 +23,23 @@ from policy_inspector.scenarios.shadowing.simple import (
 logger = logging.getLogger(__name__)
 
 
+def ip_bounds(addresses: list[AddressObject]) -> list[tuple[int, int]]:
+    """Integer ``(first, last)`` bounds of all non-FQDN ``addresses``."""
+    return [
+        addr_obj.bounds
+        for addr_obj in addresses
+        if not isinstance(addr_obj, AddressObjectFQDN)
+    ]
+
+
+def is_covered_by_any(
+    addr_obj: AddressObject, bounds: list[tuple[int, int]]
+) -> bool:
+    """Check if ``addr_obj`` fits entirely in any of the given ``bounds``."""
+    addr_bounds = addr_obj.bounds
+    return any(bounds_cover(addr_bounds, other) for other in bounds)
+
+
 def check_source_addresses_by_ip(
     rule: "AdvancedSecurityRule",
     preceding_rule: "AdvancedSecurityRule",
@@ -36,20 +57,19 @@ def check_source_addresses_by_ip(
     if AnyObj in rule.resolved_source_addresses:
         return False, "Current rule allows any source (too broad)"
 
+    preceding_bounds = ip_bounds(preceding_rule.resolved_source_addresses)
     fqdn_count = 0
     for addr_obj in rule.resolved_source_addresses:
         if isinstance(addr_obj, AddressObjectFQDN):
             logger.debug(
-                f"Skipping FQDN comparison for {addr_obj.name}={addr_obj.value}"
+                "Skipping FQDN comparison for %s=%s",
+                addr_obj.name,
+                addr_obj.value,
             )
             fqdn_count += 1
             continue
 
-        if not any(
-            addr_obj.is_covered_by(preceding_addr_obj)
-            for preceding_addr_obj in preceding_rule.resolved_source_addresses
-            if not isinstance(preceding_addr_obj, AddressObjectFQDN)
-        ):
+        if not is_covered_by_any(addr_obj, preceding_bounds):
             return (
                 False,
                 f"Source {addr_obj.name} ({addr_obj.value}) not covered by preceding rule",
@@ -82,20 +102,19 @@ def check_destination_addresses_by_ip(
     if AnyObj in rule.resolved_destination_addresses:
         return False, "Current rule allows any destination (too broad)"
 
+    preceding_bounds = ip_bounds(preceding_rule.resolved_destination_addresses)
     fqdn_count = 0
     for addr_obj in rule.resolved_destination_addresses:
         if isinstance(addr_obj, AddressObjectFQDN):
             logger.debug(
-                f"Skipping FQDN comparison for {addr_obj.name}={addr_obj.value}"
+                "Skipping FQDN comparison for %s=%s",
+                addr_obj.name,
+                addr_obj.value,
             )
             fqdn_count += 1
             continue
 
-        if not any(
-            addr_obj.is_covered_by(preceding_addr_obj)
-            for preceding_addr_obj in preceding_rule.resolved_destination_addresses
-            if not isinstance(preceding_addr_obj, AddressObjectFQDN)
-        ):
+        if not is_covered_by_any(addr_obj, preceding_bounds):
             return (
                 False,
                 f"Destination {addr_obj.name} ({addr_obj.value}) not covered by preceding rule",
@@ -147,26 +166,25 @@ class AdvancedShadowing(Shadowing):
         """Prepare address objects/groups from scenario attributes if present."""
         address_objects_by_dg = getattr(self, "_address_objects_by_dg", None)
         address_groups_by_dg = getattr(self, "_address_groups_by_dg", None)
-        self.address_objects_by_dg = {}
-        self.address_groups_by_dg = {}
         address_objects_by_dg = address_objects_by_dg or {}
         address_groups_by_dg = address_groups_by_dg or {}
-        shared_objects = address_objects_by_dg.get("shared", [])
-        shared_groups = address_groups_by_dg.get("shared", [])
 
         def to_obj_dict(objs):
             if isinstance(objs, dict):
                 return objs
             return {obj.name: obj for obj in objs}
 
+        # Shared objects are keyed once and reused by every device group
+        shared_objects = to_obj_dict(address_objects_by_dg.get("shared", []))
+        shared_groups = address_groups_by_dg.get("shared", [])
+
+        self.address_objects_by_dg = {}
+        self.address_groups_by_dg = {}
         for dg in self.device_groups:
-            dg_objects = address_objects_by_dg.get(dg, [])
+            dg_objects = to_obj_dict(address_objects_by_dg.get(dg, []))
             dg_groups = address_groups_by_dg.get(dg, [])
-            all_objects = list(shared_objects) + list(dg_objects)
-            self.address_objects_by_dg[dg] = to_obj_dict(all_objects)
-            self.address_groups_by_dg[dg] = list(shared_groups) + list(
-                dg_groups
-            )
+            self.address_objects_by_dg[dg] = {**shared_objects, **dg_objects}
+            self.address_groups_by_dg[dg] = [*shared_groups, *dg_groups]
 
     def execute(self) -> dict[str, dict[str, dict[str, CheckResult]]]:
         logger.info(
@@ -174,22 +192,23 @@ class AdvancedShadowing(Shadowing):
         )
         self.prepare_address_objects_and_groups()
         for dg in self.device_groups:
-            address_objects_dict = self.address_objects_by_dg.get(dg, {})
-            address_objects_list = list(address_objects_dict.values())
+            address_objects = self.address_objects_by_dg.get(dg, {})
             resolver = Resolver(
-                address_objects=address_objects_list,
+                address_objects=list(address_objects.values()),
                 address_groups=self.address_groups_by_dg.get(dg, []),
             )
             rules = self.security_rules_by_dg.get(dg, [])
             advanced_rules = []
             for rule in rules:
-                advanced_rule = AdvancedSecurityRule(**rule.model_dump())
-                advanced_rule.resolved_source_addresses = resolver.resolve(
+                # Fields of ``rule`` are already validated, skip re-validation
+                fields = dict(rule)
+                fields["resolved_source_addresses"] = resolver.resolve(
                     rule.source_addresses
                 )
-                advanced_rule.resolved_destination_addresses = resolver.resolve(
+                fields["resolved_destination_addresses"] = resolver.resolve(
                     rule.destination_addresses
                 )
+                advanced_rule = AdvancedSecurityRule.model_construct(**fields)
                 advanced_rules.append(advanced_rule)
             self.security_rules_by_dg[dg] = advanced_rules
 
@@ -5,33 +5,41 @@ from policy_inspector.scenarios.shadowing.advanced import AdvancedShadowing
 from policy_inspector.scenarios.shadowing.simple import Shadowing
 from policy_inspector.utils import load_jinja_template, register_export
 
+_TEMPLATE_DIR = Path(__file__).parent
+_DATE_FORMAT = "%B %d, %Y %H:%M:%S"
+
 
 @register_export(scenario_cls=Shadowing, fmt="html")
 @register_export(scenario_cls=AdvancedShadowing, fmt="html")
-def export_as_html(scenario, *args, output_path: str = None, **kwargs) -> str:
+def export_as_html(
+    scenario, *args, output_path: str = None, **kwargs
+) -> str | None:
     """
     Render the HTML report using a Jinja2 template (report_template.html).
-    If output_path is provided, save the HTML to that file.
+
+    If output_path is provided, the report is streamed into that file and
+    ``None`` is returned. Otherwise, the rendered HTML is returned.
     """
-    template_dir = Path(__file__).parent
-    template = load_jinja_template(template_dir, "report_template.html")
-    current_date = datetime.now(tz=timezone.utc).strftime("%B %d, %Y %H:%M:%S")
+    template = load_jinja_template(_TEMPLATE_DIR, "report_template.html")
+    current_date = datetime.now(tz=timezone.utc).strftime(_DATE_FORMAT)
 
     # Calculate total policies correctly
     total_policies = sum(
         len(rules) for rules in scenario.security_rules_by_dg.values()
     )
 
-    html = template.render(
-        scenario=scenario,
-        scenario_doc=getattr(scenario, "__doc__", None),
-        address_groups_count=len(getattr(scenario, "address_groups", [])),
-        address_objects_count=len(getattr(scenario, "address_objects", [])),
-        total_policies=total_policies,
-        current_date=current_date,
-    )
+    context = {
+        "scenario": scenario,
+        "scenario_doc": getattr(scenario, "__doc__", None),
+        "address_groups_count": len(getattr(scenario, "address_groups", [])),
+        "address_objects_count": len(getattr(scenario, "address_objects", [])),
+        "total_policies": total_policies,
+        "current_date": current_date,
+    }
 
     if output_path:
-        out_path = Path(output_path)
-        out_path.write_text(html, encoding="utf-8")
-    return html
+        stream = template.stream(**context)
+        stream.enable_buffering(size=64)
+        stream.dump(str(output_path), encoding="utf-8")
+        return None
+    return template.render(**context)
@@ -6,6 +6,9 @@ from policy_inspector.utils import register_show
 
 logger = logging.getLogger(__name__)
 
+_TEXT_HEADER = "=== Device Group: %s ===\nAnalysis results\n----------------"
+_TEXT_FOOTER = "----------------"
+
 
 @register_show(scenario_cls=Shadowing, fmt="text")
 @register_show(scenario_cls=AdvancedShadowing, fmt="text")
@@ -15,17 +18,17 @@ def show_as_text(scenario, *args, **kwargs) -> None:
         logger.warning("No analysis_results_by_dg found on scenario.")
         return
     for dg, results in analysis_results.items():
-        logger.info(f"=== Device Group: {dg} ===")
-        logger.info("Analysis results")
-        logger.info("----------------")
+        logger.info(_TEXT_HEADER, dg)
         for rule, shadowing_rules in results:
             if shadowing_rules:
-                logger.info(f"✖ '{rule.name}' shadowed by:")
-                for preceding_rule in shadowing_rules:
-                    logger.info(f"   • '{preceding_rule.name}'")
+                preceding = "\n".join(
+                    f"   • '{preceding_rule.name}'"
+                    for preceding_rule in shadowing_rules
+                )
+                logger.info("✖ '%s' shadowed by:\n%s", rule.name, preceding)
             else:
-                logger.debug(f"✔ '{rule.name}' not shadowed")
-        logger.info("----------------")
+                logger.debug("✔ '%s' not shadowed", rule.name)
+        logger.info(_TEXT_FOOTER)
 
 
 @register_show(scenario_cls=Shadowing, fmt="table")
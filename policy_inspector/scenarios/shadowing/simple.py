@@ -1,6 +1,7 @@
 import logging
 from collections.abc import Iterable
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Literal
 
 from policy_inspector.scenario import Scenario
 from policy_inspector.scenarios.shadowing.checks import (
@@ -36,20 +37,29 @@ AnalysisResult = list[tuple["SecurityRule", list["SecurityRule"]]]
 
 AnalysisResults = dict[str, AnalysisResult]
 
+_RULEBASES = ("pre", "post")
+"""Rulebases loaded for each device group, in evaluation order."""
+
 
 def exclude_checks(
     checks: list[CheckFunction], keywords: Iterable[str]
 ) -> list[CheckFunction]:
+    """Return ``checks`` without the ones whose name contains any keyword.
+
+    ``checks`` is returned as it is when there are no ``keywords``.
+    """
     if not keywords:
-        return []
-    checks = checks.copy()
-    logger.info(f"Excluding checks by keywords: {', '.join(keywords)}")
-    for i, check in enumerate(checks):
+        return checks
+    keywords = tuple(keywords)
+    logger.info("Excluding checks by keywords: %s", ", ".join(keywords))
+    remaining = []
+    for check in checks:
         check_name = check.__name__
         if any(keyword in check_name for keyword in keywords):
-            logger.info(f"✖ Check '{check_name}' excluded")
-            checks.pop(i)
-    return checks
+            logger.info("✖ Check '%s' excluded", check_name)
+        else:
+            remaining.append(check)
+    return remaining
 
 
 def run_checks(checks, *rules: "SecurityRule") -> dict[str, CheckResult]:
@@ -70,11 +80,13 @@ def run_checks(checks, *rules: "SecurityRule") -> dict[str, CheckResult]:
         try:
             results[check.__name__] = check(*rules)
         except Exception as ex:  # noqa: BLE001
-            logger.warning(f"☠ Error: {ex}")
-            logger.warning(f"☠ Check function: '{check.__name__}'")
+            logger.warning("☠ Error: %s", ex)
+            logger.warning("☠ Check function: '%s'", check.__name__)
+            debug = logger.isEnabledFor(logging.DEBUG)
             for i, rule in enumerate(rules, start=1):
-                logger.warning(f"☠ Rule {i}: {rule.name}")
-                logger.debug(f"☠ Rule {i}: {rule.model_dump()}")
+                logger.warning("☠ Rule %d: %s", i, rule.name)
+                if debug:
+                    logger.debug("☠ Rule %d: %s", i, rule.model_dump())
     return results
 
 
@@ -97,6 +109,7 @@ class Shadowing(Scenario):
         panorama: "PanoramaConnector" = None,
         device_groups: list[str] = None,
         security_rules_by_dg: dict[str, list["SecurityRule"]] = None,
+        max_workers: int = 1,
         **kwargs,
     ):
         """
@@ -104,9 +117,11 @@ class Shadowing(Scenario):
             panorama: An instance of PanoramaConnector for API interaction.
             device_groups: A list of device groups to be analyzed.
             security_rules_by_dg: A dictionary of security rules by device group.
+            max_workers: Number of threads loading security rules.
         """
         self.panorama = panorama
         self.device_groups = device_groups or []
+        self.max_workers = max_workers
         if security_rules_by_dg is not None:
             self.security_rules_by_dg = security_rules_by_dg
         else:
@@ -120,22 +135,37 @@ class Shadowing(Scenario):
         self.analysis_results_by_dg: dict[str, AnalysisResult] = {}
 
     def _load_security_rules_per_dg(self) -> dict[str, list["SecurityRule"]]:
-        """Load security rules from Panorama for each device group separately."""
-        rules_by_dg = {}
-        for device_group in self.device_groups:
-            rules_by_dg[device_group] = self._get_security_rules(device_group)
-        return rules_by_dg
+        """Load security rules from Panorama for each device group separately.
 
-    def _get_security_rules(self, device_group: str) -> list["SecurityRule"]:
+        With ``max_workers`` above one, pre and post rulebases of all device
+        groups are fetched in threads.
+        """
+        rules_by_dg = {dg: [] for dg in self.device_groups}
         if self.panorama is None:
-            return []
-        pre_rules = self.panorama.get_security_rules(
-            device_group=device_group, rulebase="pre"
-        )
-        post_rules = self.panorama.get_security_rules(
-            device_group=device_group, rulebase="post"
+            return rules_by_dg
+        device_groups = [dg for dg in rules_by_dg for _ in _RULEBASES]
+        rulebases = [*_RULEBASES] * len(rules_by_dg)
+        workers = min(self.max_workers, len(device_groups))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(
+                        self._get_security_rules, device_groups, rulebases
+                    )
+                )
+        else:
+            results = map(self._get_security_rules, device_groups, rulebases)
+        for device_group, rules in zip(device_groups, results, strict=True):
+            rules_by_dg[device_group].extend(rules)
+        return rules_by_dg
+
+    def _get_security_rules(
+        self, device_group: str, rulebase: Literal["pre", "post"]
+    ) -> list["SecurityRule"]:
+        """Get ``rulebase`` security rules of ``device_group`` from Panorama."""
+        return self.panorama.get_security_rules(
+            device_group=device_group, rulebase=rulebase
         )
-        return pre_rules + post_rules
 
     def execute(self) -> dict[str, ExecuteResults]:
         """Execute shadowing analysis for each device group separately."""
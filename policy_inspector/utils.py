@@ -1,20 +1,54 @@
+import functools
 import json
 import logging
-from collections.abc import Callable
+import os
+import sys
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
 
-import rich_click as click
+import click
 from click.types import Choice as clickChoice
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-from pydantic import BaseModel, ConfigDict
-from rich.logging import RichHandler
+
+_TRUE_VALUES = frozenset({"1", "true", "yes"})
+
+RICH_CLICK: bool = (
+    os.environ.get("PINS_NO_RICH", "").lower() not in _TRUE_VALUES
+)
+"""Whether to render CLI help with ``rich_click``. Set ``PINS_NO_RICH=1`` to skip it."""
+
+if RICH_CLICK:
+    from rich_click import RichGroup as BaseGroup
+else:
+    BaseGroup = click.Group
+
+
+_main_logger = logging.getLogger("policy_inspector")
+
+
+@functools.cache
+def _json_loads() -> Callable[[bytes | str], Any]:
+    """Pick JSON parser on first use.
+
+    Returns ``orjson.loads`` when it is installed and the standard
+    library ``json.loads`` otherwise.
+    """
+    try:
+        import orjson
+    except ImportError:  # pragma: no cover - optional dependency
+        return json.loads
+    return orjson.loads
+
+
+def parse_json(data: bytes | str) -> Any:
+    """Parse JSON document."""
+    return _json_loads()(data)
 
 
 def load_json(path: Path) -> list[dict[str, Any]]:
     """Load and parse a JSON file, returning its contents as a list of dictionaries."""
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return parse_json(path.read_bytes())
 
 
 _EXPORT_REGISTRY: dict[tuple[type, str], Callable] = {}
@@ -51,39 +85,64 @@ def get_show_func(scenario, fmt: str):
     return _SHOW_REGISTRY.get((type(scenario), fmt))
 
 
-def load_jinja_template(template_dir: Path, template_name: str):
-    """
-    Load a Jinja2 template from the current directory.
+@functools.cache
+def _jinja_environment(template_dir: str):
+    """Create Jinja2 environment for ``template_dir`` once per process.
+
+    The environment keeps compiled templates and recompiles them only
+    when the template file changes.
     """
+    from jinja2 import Environment, FileSystemLoader, select_autoescape
+
     env = Environment(
-        loader=FileSystemLoader(str(template_dir)),
+        loader=FileSystemLoader(template_dir),
         autoescape=select_autoescape(["html", "xml"]),
         trim_blocks=True,
         lstrip_blocks=True,
     )
     env.globals["enumerate"] = enumerate
     env.globals["getattr"] = getattr
-    return env.get_template(template_name)
+    return env
+
+
+def load_jinja_template(template_dir: Path, template_name: str):
+    """
+    Load a Jinja2 template from the current directory.
+    """
+    return _jinja_environment(str(template_dir)).get_template(template_name)
 
 
 def _verbose_callback(ctx: click.Context, param, value) -> None:
-    """Callback function for verbose option."""
-    if not value:
+    """Callback function for verbose option.
+
+    Also configures the main logger on the first command invocation.
+    Does nothing during shell completion.
+    """
+    if ctx.resilient_parsing:
+        return
+    if not _main_logger.handlers:
+        config_logger(_main_logger.name)
+    count = len(value) if value else 0
+    if not count:
+        return
+    _main_logger.setLevel(logging.DEBUG)
+    if count < 2:
+        return
+    handler = _main_logger.handlers[0]
+    render = getattr(handler, "_log_render", None)
+    if render is None:
+        plain_format = (
+            _PLAIN_FORMAT_VERBOSE if count > 2 else _PLAIN_FORMAT_LEVEL
+        )
+        handler.setFormatter(logging.Formatter(plain_format))
         return
-    _logger = logging.getLogger(__name__).parent
-    count = len(value)
-    if count > 0:
-        _logger.setLevel(logging.DEBUG)
-    if count > 1:
-        handler = _logger.handlers[0]
-        handler._log_render.show_level = True
+    render.show_level = True
     if count > 2:
-        handler = _logger.handlers[0]
-        handler._log_render.show_path = True
-        handler._log_render.show_time = True
+        render.show_path = True
+        render.show_time = True
 
 
-class VerboseGroup(click.RichGroup):
+class VerboseGroup(BaseGroup):
     """Click Group that automatically adds verbose option to all commands."""
 
     def __init__(self, name=None, commands=None, **attrs):
@@ -91,8 +150,13 @@ class VerboseGroup(click.RichGroup):
         self.params.append(self._verbose_option())
 
     def add_command(self, cmd, name=None):
-        """Override to add verbose option to all commands."""
-        cmd.params.append(self._verbose_option())
+        """Override to add verbose option to all commands.
+
+        Commands that already have it, like nested ``VerboseGroup``, are
+        left as they are.
+        """
+        if not any("--verbose" in param.opts for param in cmd.params):
+            cmd.params.append(self._verbose_option())
         super().add_command(cmd, name)
 
     @staticmethod
@@ -108,6 +172,24 @@ class VerboseGroup(click.RichGroup):
         )
 
 
+_PLAIN_FORMAT_LEVEL = "%(levelname)-8s %(message)s"
+_PLAIN_FORMAT_VERBOSE = (
+    "%(asctime)s %(levelname)-8s %(message)s [%(filename)s:%(lineno)d]"
+)
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """``StreamHandler`` that always writes to the current ``sys.stdout``."""
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value) -> None:
+        pass
+
+
 def config_logger(
     logger_name: str = "policy_inspector",
     default_level: str = "INFO",
@@ -117,53 +199,66 @@ def config_logger(
     """
     Configure ``logger`` with ``RichHandler``
 
+    Falls back to a plain stdlib handler when output is not a terminal
+    or ``rich`` is disabled, so pipes and CI runs never build a console.
+
     Args:
         logger: Instance of a ``logging.Logger``
         level: Default level of a ``logger``.
         log_format: Logs format.
         date_format: Date format in logs.
     """
-    rich_handler = RichHandler(
-        rich_tracebacks=True,
-        show_path=False,
-        show_time=False,
-        show_level=False,
-        omit_repeated_times=False,
-    )
-    rich_handler.enable_link_path = True
+    if RICH_CLICK and sys.stdout.isatty():
+        from rich.logging import RichHandler
+
+        handler = RichHandler(
+            rich_tracebacks=True,
+            show_path=False,
+            show_time=False,
+            show_level=False,
+            omit_repeated_times=False,
+        )
+        handler.enable_link_path = True
+    else:
+        handler = _StdoutHandler()
     formatter = logging.Formatter(log_format, date_format, "%")
-    rich_handler.setFormatter(formatter)
+    handler.setFormatter(formatter)
 
     main_logger = logging.getLogger(logger_name)
-    main_logger.handlers = [rich_handler]
+    main_logger.handlers = [handler]
     main_logger.setLevel(logging.INFO)
 
 
-class Example(BaseModel):
-    """Represents an example that can be run."""
+@dataclass(frozen=True)
+class Example:
+    """Represents an example that can be run.
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    A plain dataclass, so defining examples does not import ``pydantic``.
+    """
 
     name: str
-    scenario: type
+    scenario: str
+    """Command name of the Scenario, like ``shadowing``."""
     data_dir: str
     device_group: str
     show: tuple[str, ...] = ("text",)
     export: tuple[str, ...] = ()
-    args: dict[str, Any] = {}
+    args: dict[str, Any] = field(default_factory=dict, hash=False)
 
     def get_data_dir(self) -> Path:
         """Get the absolute path to the data directory."""
-        # Get the directory where cli.py is located (policy_inspector package)
-        cli_dir = Path(__file__).parent
-        # Construct the path to the example data directory
-        return cli_dir / "example" / self.data_dir
+        return _example_dir() / self.data_dir
 
 
 class ExampleChoice(clickChoice):
-    def __init__(self, examples: list[Example]) -> None:
-        self.examples = {example.name: example for example in examples}
-        super().__init__(list(self.examples.keys()), False)  # noqa: FBT003
+    def __init__(self, examples: list[Example] | Mapping[str, Example]) -> None:
+        if not isinstance(examples, Mapping):
+            examples = {example.name: example for example in examples}
+        self.examples = examples
+        self._casefolded = {
+            name.casefold(): example for name, example in examples.items()
+        }
+        super().__init__(tuple(self.examples), False)  # noqa: FBT003
 
     def convert(
         self,
@@ -172,20 +267,16 @@ class ExampleChoice(clickChoice):
         ctx: Optional["click.Context"],
     ) -> Any:
         normed_value = value
-        normed_choices = self.examples
+        normed_choices = self._casefolded
 
         if ctx is not None and ctx.token_normalize_func is not None:
             normed_value = ctx.token_normalize_func(value)
             normed_choices = {
-                ctx.token_normalize_func(normed_choice): original
-                for normed_choice, original in normed_choices.items()
+                ctx.token_normalize_func(name).casefold(): original
+                for name, original in self.examples.items()
             }
 
         normed_value = normed_value.casefold()
-        normed_choices = {
-            normed_choice.casefold(): original
-            for normed_choice, original in normed_choices.items()
-        }
 
         try:
             return normed_choices[normed_value]
@@ -195,7 +286,7 @@ class ExampleChoice(clickChoice):
             )
 
         if len(matching_choices) == 1:
-            return matching_choices[0]
+            return normed_choices[matching_choices[0]]
 
         if not matching_choices:
             choices_str = ", ".join(map(repr, self.choices))
@@ -206,6 +297,12 @@ class ExampleChoice(clickChoice):
         raise click.UsageError(message=message, ctx=ctx)
 
 
+@functools.cache
+def _example_dir() -> Path:
+    """Get the directory with bundled example data."""
+    return Path(__file__).parent / "example"
+
+
 def get_example_file_path(name: str) -> Path:
     """Get the path to an example file."""
-    return Path(__file__).parent / "example" / name
+    return _example_dir() / name
@@ -1,3 +1,8 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 from click.testing import CliRunner
 
@@ -9,6 +14,23 @@ def runner():
     return CliRunner()
 
 
+def loaded_after_cli_import(module: str, env: dict | None = None) -> bool:
+    """Import ``cli`` in a fresh interpreter and check if ``module`` loaded."""
+    code = (
+        "import sys; from policy_inspector import cli; "
+        f"print({module!r} in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[1],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip() == "True"
+
+
 @pytest.mark.parametrize("args", [None, ["--help"]])
 def test_main_command_help(runner, args):
     result = runner.invoke(cli.main, args, catch_exceptions=False)
@@ -180,3 +202,111 @@ def test_run_example_with_combined_options(runner):
     )
     for phrase in phrases:
         assert phrase in result.output
+
+
+def test_run_example_passes_max_workers(runner, monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        cli,
+        "run_scenario_with_mock_data",
+        lambda **kwargs: calls.append(kwargs),
+    )
+    result = runner.invoke(
+        cli.run_example, ["shadowing-multiple-dg", "--max-workers", "4"]
+    )
+    assert result.exit_code == 0, result.output
+    assert calls[0]["max_workers"] == 4
+
+
+def test_run_shadowing_passes_max_workers(runner, monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        cli,
+        "run_scenario_with_panorama",
+        lambda scenario_cls, **kwargs: calls.append(kwargs),
+    )
+    result = runner.invoke(
+        cli.run_shadowing,
+        ["--panorama-hostname", "panorama", "--config", "missing.yaml"],
+    )
+    assert result.exit_code == 0, result.output
+    assert calls[0]["max_workers"] == 1
+
+
+def test_get_scenarios_is_cached():
+    scenarios = cli.get_scenarios()
+    assert set(scenarios) == {"shadowing", "shadowingvalue"}
+    assert cli.get_scenarios() is scenarios
+
+
+@pytest.mark.parametrize(
+    "value,loaded",
+    [("1", False), ("true", False), ("YES", False), ("0", True), ("", True)],
+)
+def test_plain_click_without_rich(value, loaded):
+    env = {**os.environ, "PINS_NO_RICH": value}
+    assert loaded_after_cli_import("rich_click", env) is loaded
+
+
+@pytest.mark.parametrize("module", ["yaml", "pydantic"])
+def test_import_does_not_load(module):
+    assert not loaded_after_cli_import(module)
+
+
+@pytest.mark.parametrize("value", ["SHADOWING-BASIC", "shadowing-b"])
+def test_example_choice_returns_example(value):
+    choice = cli.ExampleChoice(cli.examples)
+    example = choice.convert(value, None, None)
+    assert isinstance(example, cli.Example)
+    assert example.name == "shadowing-basic"
+
+
+def test_examples_are_hashable():
+    assert len({*cli.examples}) == len(cli.examples)
+
+
+def test_plain_log_handler_without_tty(monkeypatch):
+    import logging
+
+    from policy_inspector.utils import config_logger
+
+    logger = logging.getLogger("policy_inspector.test_plain")
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: False)
+    monkeypatch.setattr(logger, "handlers", [])
+    monkeypatch.setattr(logger, "level", logger.level)
+    config_logger(logger.name)
+    (handler,) = logger.handlers
+    assert type(handler).__name__ == "_StdoutHandler"
+    assert handler.stream is sys.stdout
+
+
+def test_short_doc_collapses_whitespace():
+    def check():
+        """
+        First line.
+            Second line.
+        """
+
+    def undocumented():
+        pass
+
+    assert cli._short_doc(check) == "First line. Second line."
+    assert cli._short_doc(undocumented) == ""
+
+
+def test_verbose_callback_skipped_during_completion(monkeypatch):
+    import logging
+
+    from policy_inspector import utils
+
+    calls = []
+    monkeypatch.setattr(utils, "config_logger", calls.append)
+    monkeypatch.setattr(logging.getLogger("policy_inspector"), "handlers", [])
+    ctx = cli.main.make_context("pins", ["list"], resilient_parsing=True)
+    utils._verbose_callback(ctx, None, ("v",))
+    assert calls == []
+
+
+def test_run_group_has_single_verbose_option():
+    verbose = [p for p in cli.main_run.params if "--verbose" in p.opts]
+    assert len(verbose) == 1
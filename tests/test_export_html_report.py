@@ -182,3 +182,22 @@ def test_export_as_html_big_report():
     assert out_path.exists()
     # Optionally check some expected content
     assert "Firewall Policy Analysis Report" in html
+
+
+def test_export_as_html_streams_to_output_path(tmp_path):
+    scenario = make_scenario(Shadowing)
+    out_path = tmp_path / "report.html"
+    assert export_as_html(scenario, output_path=str(out_path)) is None
+    content = out_path.read_text(encoding="utf-8")
+    assert "<html" in content.lower()
+    assert "Firewall Policy Analysis Report" in content
+
+
+def test_load_jinja_template_is_cached():
+    from policy_inspector.scenarios.shadowing import export
+    from policy_inspector.utils import load_jinja_template
+
+    template_dir = Path(export.__file__).parent
+    first = load_jinja_template(template_dir, "report_template.html")
+    second = load_jinja_template(template_dir, "report_template.html")
+    assert first is second
@@ -0,0 +1,19 @@
+from policy_inspector.mock_panorama import MockPanoramaConnector, _load_entries
+from policy_inspector.model.security_rule import SecurityRule
+from policy_inspector.utils import get_example_file_path
+
+
+def test_security_rules_file_parsed_once():
+    panorama = MockPanoramaConnector(data_dir=get_example_file_path("1"))
+    _load_entries.cache_clear()
+    pre_rules = panorama.get_security_rules(rulebase="pre")
+    post_rules = panorama.get_security_rules(rulebase="post")
+    assert pre_rules == post_rules
+    assert all(isinstance(rule, SecurityRule) for rule in pre_rules)
+    assert _load_entries.cache_info().misses == 1
+    assert pre_rules[0] is not post_rules[0]
+
+
+def test_missing_file_returns_empty_list(tmp_path):
+    panorama = MockPanoramaConnector(data_dir=tmp_path)
+    assert panorama.get_address_groups() == []
@@ -146,3 +146,30 @@ def test_missing_address_in_csv():
     csv_data = {"Name": "missing-addr", "Type": "IP Address"}
     with pytest.raises(KeyError):
         AddressObject.parse_csv([csv_data])
+
+
+def test_bounds_do_not_affect_equality():
+    obj = AddressObjectIPNetwork(name="net", value="10.0.0.0/30")
+    assert obj.bounds == (
+        int(IPv4Address("10.0.0.0")),
+        int(IPv4Address("10.0.0.3")),
+    )
+    assert obj == AddressObjectIPNetwork(name="net", value="10.0.0.0/30")
+    assert "bounds" not in obj.model_dump()
+
+
+def test_ip_network_parsing_is_shared():
+    first = AddressObjectIPNetwork(name="a", value="10.1.0.0/16")
+    second = AddressObjectIPNetwork(name="b", value="10.1.0.0/16")
+    assert first.value is second.value
+
+
+def test_is_covered_by_network_and_range():
+    network = AddressObjectIPNetwork(name="net", value="10.0.0.0/24")
+    host = AddressObjectIPNetwork(name="host", value="10.0.0.5/32")
+    ip_range = AddressObjectIPRange(name="range", value="10.0.0.1-10.0.0.9")
+    assert host.is_covered_by(network)
+    assert host.is_covered_by(ip_range)
+    assert ip_range.is_covered_by(network)
+    assert not network.is_covered_by(ip_range)
+    assert not ip_range.is_covered_by(host)
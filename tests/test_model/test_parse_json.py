@@ -1,5 +1,8 @@
 # ruff: noqa: N802
 
+import json
+import sys
+
 import pytest
 
 from policy_inspector.model.address_group import AddressGroup
@@ -25,3 +28,24 @@ def test_load_from_example_file(model_with_path):
     file_data = load_json(file_path)
     items = cls.parse_json(file_data)
     assert all(isinstance(item, cls) for item in items)
+
+
+def test_load_json_without_orjson(monkeypatch):
+    from policy_inspector import utils
+
+    file_path = get_example_file_path("1/policies.json")
+    expected = load_json(file_path)
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    utils._json_loads.cache_clear()
+    try:
+        assert utils._json_loads() is json.loads
+        assert load_json(file_path) == expected
+    finally:
+        utils._json_loads.cache_clear()
+
+
+def test_parse_json_accepts_bytes_and_str():
+    from policy_inspector.utils import parse_json
+
+    document = '{"result": {"entry": [{"@name": "rule1"}]}}'
+    assert parse_json(document.encode()) == parse_json(document)
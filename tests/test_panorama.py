@@ -0,0 +1,80 @@
+import pytest
+
+from policy_inspector.panorama import PanoramaConnector
+
+
+class FakeResponse:
+    def __init__(self, content: bytes):
+        self.content = content
+        self.text = content.decode()
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self, content: bytes):
+        self.content = content
+
+    def request(self, method, url, **kwargs):
+        return FakeResponse(self.content)
+
+
+@pytest.fixture
+def connector(monkeypatch):
+    monkeypatch.setattr(PanoramaConnector, "_authenticate", lambda *args: None)
+    return PanoramaConnector("panorama", "user", "password")
+
+
+def test_api_request_parses_json(connector):
+    connector.session = FakeSession(b'{"result": {"entry": [{"@name": "a"}]}}')
+    entries = connector._get_api_request("Objects/Addresses")
+    assert entries == [{"@name": "a"}]
+
+
+def test_api_request_non_json_response(connector):
+    connector.session = FakeSession(b"<html>Maintenance</html>")
+    with pytest.raises(ValueError, match="Panorama API request failed") as ex:
+        connector._api_request("Objects/Addresses", "GET")
+    assert "<html>Maintenance</html>" in str(ex.value)
+
+
+def test_session_per_thread(connector):
+    from concurrent.futures import ThreadPoolExecutor
+
+    session = connector.session
+    assert connector.session is session
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        thread_session = executor.submit(lambda: connector.session).result()
+    assert thread_session is not session
+
+
+def test_concurrent_rule_loading_uses_session_per_thread(monkeypatch):
+    import threading
+
+    from policy_inspector.scenarios.shadowing.simple import Shadowing
+
+    threads_by_session = {}
+
+    class ThreadSession(FakeSession):
+        def __init__(self):
+            super().__init__(b'{"result": {"entry": [{"@name": "rule"}]}}')
+
+        def request(self, method, url, **kwargs):
+            threads = threads_by_session.setdefault(id(self), set())
+            threads.add(threading.get_ident())
+            return super().request(method, url, **kwargs)
+
+    monkeypatch.setattr("policy_inspector.panorama.Session", ThreadSession)
+    monkeypatch.setattr(PanoramaConnector, "_authenticate", lambda *args: None)
+    connector = PanoramaConnector("panorama", "user", "password")
+    scenario = Shadowing(
+        panorama=connector, device_groups=["dg1", "dg2"], max_workers=4
+    )
+    rules_by_dg = scenario.security_rules_by_dg
+    assert {dg: len(rules) for dg, rules in rules_by_dg.items()} == {
+        "dg1": 2,
+        "dg2": 2,
+    }
+    assert threads_by_session
+    assert all(len(threads) == 1 for threads in threads_by_session.values())
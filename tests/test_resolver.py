@@ -151,3 +151,24 @@ def test_duplicate_entries(address_objects):
     resolver = Resolver(address_objects, groups)
     result = resolver.resolve({"dupes"})
     assert len(result) == 1
+
+
+def test_names_cache_usage(objects_and_groups):
+    resolver = Resolver(*objects_and_groups)
+    first = resolver.resolve({"web-servers", "db1"})
+    assert frozenset({"web-servers", "db1"}) in resolver.names_cache
+    second = resolver.resolve(["db1", "web-servers"])
+    assert first == second
+    assert first is not second
+
+
+def test_shared_members_resolved_once(objects_and_groups):
+    address_objects, address_groups = objects_and_groups
+    groups = address_groups + [
+        AddressGroup(name="overlap", static={"nested-group", "app-tier"}),
+    ]
+    resolver = Resolver(address_objects, groups)
+    result = resolver.resolve({"overlap", "web1"})
+    names = [obj.name for obj in result]
+    assert sorted(names) == sorted(set(names))
+    assert set(names) == {"web1", "web2", "web4_TEMP", "web5", "db1", "db2"}
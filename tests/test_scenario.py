@@ -30,3 +30,20 @@ class TestScenarioWithImplementation:
             scenario.execute()
         with pytest.raises(NotImplementedError):
             scenario.analyze(None)
+
+
+def test_report_handles_each_format_once():
+    from policy_inspector.utils import register_show
+
+    class ReportScenario(Scenario):
+        pass
+
+    calls = []
+
+    @register_show(scenario_cls=ReportScenario, fmt="text")
+    def show_text(scenario, *args, **kwargs):
+        calls.append(scenario)
+
+    scenario = ReportScenario(panorama=None)
+    scenario.report(show=("text", "text"))
+    assert calls == [scenario]
@@ -162,3 +162,17 @@ def test_(check_func, rule_params, preceding_rule_params, expected_result):
     )
     result = check_func(rule, preceding_rule)
     assert result == expected_result
+
+
+def test_exclude_checks():
+    from policy_inspector.scenarios.shadowing.simple import (
+        Shadowing,
+        exclude_checks,
+    )
+
+    checks = Shadowing.checks
+    assert exclude_checks(checks, ()) is checks
+    remaining = exclude_checks(checks, ["zone"])
+    assert check_source_zone not in remaining
+    assert check_destination_zone not in remaining
+    assert len(remaining) == len(checks) - 2
@@ -7,7 +7,11 @@ from policy_inspector.model.address_object import (
     AddressObjectIPNetwork,
 )
 from policy_inspector.model.security_rule import SecurityRule
-from policy_inspector.scenarios.shadowing.advanced import AdvancedShadowing
+from policy_inspector.scenarios.shadowing.advanced import (
+    AdvancedShadowing,
+    ip_bounds,
+    is_covered_by_any,
+)
 
 
 @pytest.fixture
@@ -202,3 +206,75 @@ def test_identical_rules(address_objects):
     # Each subsequent rule should check all preceding rules
     for i, rule_name in enumerate(["rule0", "rule1", "rule2"]):
         assert len(results["test"][rule_name]) == i
+
+
+def test_is_covered_by_any_bounds(address_objects):
+    wide, narrow, fqdn = address_objects
+    bounds = ip_bounds([wide, fqdn])
+    assert len(bounds) == 1
+    assert is_covered_by_any(narrow, bounds)
+    assert not is_covered_by_any(wide, ip_bounds([narrow]))
+
+
+def test_added_device_group_gets_address_objects(base_rules, address_objects):
+    scenario = AdvancedShadowing(
+        panorama=None,
+        device_groups=["dg1"],
+        security_rules_by_dg={"dg1": base_rules},
+        address_objects_by_dg={"shared": address_objects},
+    )
+    scenario.execute()
+    scenario.device_groups.append("dg2")
+    scenario.security_rules_by_dg["dg2"] = base_rules
+    results = scenario.execute()
+    assert results["dg2"] == results["dg1"]
+
+
+def test_device_groups_loaded_concurrently_keep_order():
+    class DummyPanorama:
+        def get_security_rules(self, device_group, rulebase):
+            return [
+                SecurityRule(name=f"{device_group}-{rulebase}", action="allow")
+            ]
+
+    device_groups = ["dg1", "dg2", "dg3"]
+    sequential = AdvancedShadowing(
+        panorama=DummyPanorama(), device_groups=device_groups
+    )
+    concurrent = AdvancedShadowing(
+        panorama=DummyPanorama(), device_groups=device_groups, max_workers=3
+    )
+    assert list(concurrent.security_rules_by_dg) == device_groups
+    assert concurrent.security_rules_by_dg == sequential.security_rules_by_dg
+
+
+def test_single_device_group_rulebases_loaded_concurrently():
+    class DummyPanorama:
+        def get_security_rules(self, device_group, rulebase):
+            return [SecurityRule(name=rulebase, action="allow")]
+
+    scenario = AdvancedShadowing(
+        panorama=DummyPanorama(), device_groups=["dg1"], max_workers=2
+    )
+    rules = scenario.security_rules_by_dg["dg1"]
+    assert [rule.name for rule in rules] == ["pre", "post"]
+
+
+def test_shared_address_objects_merged_per_device_group(address_objects):
+    local = AddressObjectIPNetwork(
+        name="wide-net", value=IPv4Network("192.168.0.0/16")
+    )
+    scenario = AdvancedShadowing(
+        device_groups=["dg1", "dg2"],
+        security_rules_by_dg={"dg1": [], "dg2": []},
+        address_objects_by_dg={
+            "shared": address_objects,
+            "dg1": {local.name: local},
+        },
+    )
+    scenario.prepare_address_objects_and_groups()
+    assert scenario.address_objects_by_dg["dg1"]["wide-net"] is local
+    assert (
+        scenario.address_objects_by_dg["dg2"]["wide-net"] is address_objects[0]
+    )
+    assert len(scenario.address_objects_by_dg["dg2"]) == len(address_objects)
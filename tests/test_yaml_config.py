@@ -181,5 +181,29 @@ show:
         Path(config_file).unlink()
 
 
+def test_yaml_config_parsed_once(tmp_path):
+    """Test unchanged config file is parsed only once."""
+    from policy_inspector.config import _load_yaml
+
+    @config_option(default="test_config.yaml")
+    @show_options
+    @click.command()
+    def test_command(show: tuple[str, ...]):
+        """Test command."""
+        click.echo(f"show={show}")
+
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("show:\n  - table\n")
+    runner = CliRunner()
+
+    _load_yaml.cache_clear()
+    for _ in range(3):
+        result = runner.invoke(test_command, ["--config", str(config_file)])
+        assert result.exit_code == 0
+        assert "show=('table',)" in result.output
+        assert "default_map" not in result.output
+    assert _load_yaml.cache_info().misses == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__])